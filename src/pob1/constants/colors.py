@@ -4,14 +4,21 @@ Color constants and color-related functionality for Path of Building.
 This module contains all the color codes used throughout the application for
 consistent styling and visual feedback.
 """
+import functools
+import re
+import types
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, Optional, Tuple
 
-from pydantic import BaseModel, field_validator
-
 
 class ColorCode(str, Enum):
-    """Color code identifiers used throughout the application."""
+    """
+    Color code identifiers used throughout the application.
+
+    The members are for typing and discoverability only; the color tables are keyed by their plain
+    string values.
+    """
     NORMAL = "NORMAL"
     MAGIC = "MAGIC"
     RARE = "RARE"
@@ -70,116 +77,164 @@ class ColorCode(str, Enum):
     CRUCIBLE = "CRUCIBLE"
 
 
-class ColorCodes(BaseModel):
+# Default color values, keyed by the plain string name of each ColorCode. Plain string keys keep
+# lookups on the C-level str hash instead of going through the Enum machinery.
+_DEFAULT_CODES: Dict[str, str] = {
+    "NORMAL": "^xC8C8C8",
+    "MAGIC": "^x8888FF",
+    "RARE": "^xFFFF77",
+    "UNIQUE": "^xAF6025",
+    "RELIC": "^x60C060",
+    "GEM": "^x1AA29B",
+    "PROPHECY": "^xB54BFF",
+    "CURRENCY": "^xAA9E82",
+    "CRAFTED": "^xB8DAF1",
+    "CUSTOM": "^x5CF0BB",
+    "SOURCE": "^x88FFFF",
+    "UNSUPPORTED": "^xF05050",
+    "WARNING": "^xFF9922",
+    "TIP": "^x80A080",
+    "FIRE": "^xB97123",
+    "COLD": "^x3F6DB3",
+    "LIGHTNING": "^xADAA47",
+    "CHAOS": "^xD02090",
+    "POSITIVE": "^x33FF77",
+    "NEGATIVE": "^xDD0022",
+    "HIGHLIGHT": "^xFF0000",
+    "OFFENCE": "^xE07030",
+    "DEFENCE": "^x8080E0",
+    # Character classes
+    "SCION": "^xFFF0F0",
+    "MARAUDER": "^xE05030",
+    "RANGER": "^x70FF70",
+    "WITCH": "^x7070FF",
+    "DUELIST": "^xE0E070",
+    "TEMPLAR": "^xC040FF",
+    "SHADOW": "^x30C0D0",
+    # Equipment slots
+    "MAINHAND": "^x50FF50",
+    "MAINHANDBG": "^x071907",
+    "OFFHAND": "^xB7B7FF",
+    "OFFHANDBG": "^x070719",
+    # Influence types
+    "SHAPER": "^x55BBFF",
+    "ELDER": "^xAA77CC",
+    "FRACTURED": "^xA29160",
+    "ADJUDICATOR": "^xE9F831",
+    "BASILISK": "^x00CB3A",
+    "CRUSADER": "^x2946FC",
+    "EYRIE": "^xAAB7B8",
+    # Status effects
+    "CLEANSING": "^xF24141",
+    "TANGLE": "^x038C8C",
+    "CHILLBG": "^x151e26",
+    "FREEZEBG": "^x0c262b",
+    "SHOCKBG": "^x191732",
+    "SCORCHBG": "^x270b00",
+    "BRITTLEBG": "^x00122b",
+    "SAPBG": "^x261500",
+    # Other
+    "SCOURGE": "^xFF6E25",
+    "CRUCIBLE": "^xFFA500",
+}
+
+# Derived color codes alias a base color. They are resolved once here so that constructing a ColorCodes
+# is a single dict copy rather than a per-instance loop of lookups and asserts.
+_DERIVED_CODES: Dict[str, str] = {
+    "STRENGTH": _DEFAULT_CODES["MARAUDER"],
+    "DEXTERITY": _DEFAULT_CODES["RANGER"],
+    "INTELLIGENCE": _DEFAULT_CODES["WITCH"],
+    "LIFE": _DEFAULT_CODES["MARAUDER"],
+    "MANA": _DEFAULT_CODES["WITCH"],
+    "ES": _DEFAULT_CODES["SOURCE"],
+    "WARD": _DEFAULT_CODES["RARE"],
+    "ARMOUR": _DEFAULT_CODES["NORMAL"],
+    "EVASION": _DEFAULT_CODES["POSITIVE"],
+    "RAGE": _DEFAULT_CODES["WARNING"],
+    "PHYS": _DEFAULT_CODES["NORMAL"],
+}
+# A derived code must never shadow a base code.
+assert _DERIVED_CODES.keys().isdisjoint(_DEFAULT_CODES.keys()), "Derived color codes must not shadow base codes"
+_DEFAULT_CODES.update(_DERIVED_CODES)
+
+# Exactly six hex digits, as one C-level match. Stricter than int(value, 16), which also accepts a sign,
+# underscores between digits, and surrounding whitespace.
+_HEX6_FULLMATCH = re.compile(r"[0-9A-Fa-f]{6}").fullmatch
+
+
+def _validate_default_codes() -> None:
+    """Assert every default color code is a well formed "^x" + 6 hex string."""
+    for code_name, color_value in _DEFAULT_CODES.items():
+        # Assert color codes start with the prefix
+        assert color_value.startswith("^x"), f"Color code {code_name} must start with '^x'"
+        # Assert color codes are the correct length (prefix + 6 hex chars)
+        assert len(color_value) == 8, f"Color code {code_name} must be 8 characters (^x + 6 hex)"
+        # Assert the hex portion contains valid hex characters
+        assert _HEX6_FULLMATCH(color_value[2:]) is not None, f"Color code {code_name} contains invalid hex characters"
+
+
+# Every ColorCodes starts as a copy of the static default table, so checking the table once at import covers
+# every instance. Gating on __debug__ lets `python -O` skip the check entirely.
+if __debug__:
+    _validate_default_codes()
+
+
+@functools.lru_cache(maxsize=256)
+def _hex_to_rgb(hex_color: str) -> Optional[Tuple[float, float, float]]:
+    """
+    Convert a bare six digit hex string to RGB values.
+
+    The color table holds a few dozen distinct values, so caching the pure parse means repeated
+    conversions of the same color skip it entirely.
+    """
+    if _HEX6_FULLMATCH(hex_color) is None:
+        return None
+
+    # One C-level parse of all six digits, then split the channels with shifts and masks. This avoids
+    # three substring allocations and three separate int() parses. The match above guarantees the parse.
+    rgb_int = int(hex_color, 16)
+    assert 0 <= rgb_int <= 0xFFFFFF, f"Parsed hex color out of range: {hex_color}"
+
+    # Divide rather than multiply by 1/255: the reciprocal is off by one ulp for some channel values, and the
+    # cache in front of this function already makes the arithmetic cost moot.
+    rgb_values = (
+        ((rgb_int >> 16) & 0xFF) / 255,
+        ((rgb_int >> 8) & 0xFF) / 255,
+        (rgb_int & 0xFF) / 255,
+    )
+    # Post-condition assertions
+    assert len(rgb_values) == 3, "RGB conversion failed to produce 3 values"
+    assert all(0 <= v <= 1 for v in rgb_values), "RGB values out of range"
+    return rgb_values
+
+
+# RGB form of the default highlight color, so a fresh or reset ColorCodes agrees with what update_color_code
+# would compute for the same HIGHLIGHT code.
+_DEFAULT_RGB_HIGHLIGHT: Optional[Tuple[float, float, float]] = _hex_to_rgb(_DEFAULT_CODES["HIGHLIGHT"].removeprefix("^x"))
+assert _DEFAULT_RGB_HIGHLIGHT is not None, "Default HIGHLIGHT color must convert to RGB"
+
+
+@dataclass(slots=True)
+class ColorCodes:
     """
     Container for all color codes used in the application.
-    Uses Pydantic for validation and type safety.
+
+    The codes are a small static lookup table with no external input, so a plain slotted dataclass is
+    enough: there is no schema to build at import and nothing to validate beyond the table itself.
     """
-    codes: Dict[str, str]
-    rgb_highlight: Optional[Tuple[float, float, float]] = None
+    codes: Dict[str, str] = field(init=False)
+    # Not a constructor argument: it always tracks codes["HIGHLIGHT"]. It starts at the default highlight color
+    # and only changes through reset or update_color_code, whose hex_to_rgb asserts the 0..1 range.
+    rgb_highlight: Optional[Tuple[float, float, float]] = field(default=_DEFAULT_RGB_HIGHLIGHT, init=False)
 
-    def __init__(self):
+    def __post_init__(self) -> None:
         """Initialize with default color values."""
-        super().__init__(codes={
-            ColorCode.NORMAL: "^xC8C8C8",
-            ColorCode.MAGIC: "^x8888FF",
-            ColorCode.RARE: "^xFFFF77",
-            ColorCode.UNIQUE: "^xAF6025",
-            ColorCode.RELIC: "^x60C060",
-            ColorCode.GEM: "^x1AA29B",
-            ColorCode.PROPHECY: "^xB54BFF",
-            ColorCode.CURRENCY: "^xAA9E82",
-            ColorCode.CRAFTED: "^xB8DAF1",
-            ColorCode.CUSTOM: "^x5CF0BB",
-            ColorCode.SOURCE: "^x88FFFF",
-            ColorCode.UNSUPPORTED: "^xF05050",
-            ColorCode.WARNING: "^xFF9922",
-            ColorCode.TIP: "^x80A080",
-            ColorCode.FIRE: "^xB97123",
-            ColorCode.COLD: "^x3F6DB3",
-            ColorCode.LIGHTNING: "^xADAA47",
-            ColorCode.CHAOS: "^xD02090",
-            ColorCode.POSITIVE: "^x33FF77",
-            ColorCode.NEGATIVE: "^xDD0022",
-            ColorCode.HIGHLIGHT: "^xFF0000",
-            ColorCode.OFFENCE: "^xE07030",
-            ColorCode.DEFENCE: "^x8080E0",
-            # Character classes
-            ColorCode.SCION: "^xFFF0F0",
-            ColorCode.MARAUDER: "^xE05030",
-            ColorCode.RANGER: "^x70FF70",
-            ColorCode.WITCH: "^x7070FF",
-            ColorCode.DUELIST: "^xE0E070",
-            ColorCode.TEMPLAR: "^xC040FF",
-            ColorCode.SHADOW: "^x30C0D0",
-            # Equipment slots
-            ColorCode.MAINHAND: "^x50FF50",
-            ColorCode.MAINHANDBG: "^x071907",
-            ColorCode.OFFHAND: "^xB7B7FF",
-            ColorCode.OFFHANDBG: "^x070719",
-            # Influence types
-            ColorCode.SHAPER: "^x55BBFF",
-            ColorCode.ELDER: "^xAA77CC",
-            ColorCode.FRACTURED: "^xA29160",
-            ColorCode.ADJUDICATOR: "^xE9F831",
-            ColorCode.BASILISK: "^x00CB3A",
-            ColorCode.CRUSADER: "^x2946FC",
-            ColorCode.EYRIE: "^xAAB7B8",
-            # Status effects
-            ColorCode.CLEANSING: "^xF24141",
-            ColorCode.TANGLE: "^x038C8C",
-            ColorCode.CHILLBG: "^x151e26",
-            ColorCode.FREEZEBG: "^x0c262b",
-            ColorCode.SHOCKBG: "^x191732",
-            ColorCode.SCORCHBG: "^x270b00",
-            ColorCode.BRITTLEBG: "^x00122b",
-            ColorCode.SAPBG: "^x261500",
-            # Other
-            ColorCode.SCOURGE: "^xFF6E25",
-            ColorCode.CRUCIBLE: "^xFFA500"
-        })
-
-        # Add derived color codes
-        derived_mappings = {
-            "STRENGTH": ColorCode.MARAUDER,
-            "DEXTERITY": ColorCode.RANGER,
-            "INTELLIGENCE": ColorCode.WITCH,
-            "LIFE": ColorCode.MARAUDER,
-            "MANA": ColorCode.WITCH,
-            "ES": ColorCode.SOURCE,
-            "WARD": ColorCode.RARE,
-            "ARMOUR": ColorCode.NORMAL,
-            "EVASION": ColorCode.POSITIVE,
-            "RAGE": ColorCode.WARNING,
-            "PHYS": ColorCode.NORMAL
-        }
-        
-        # Assert and add derived colors
-        for derived, base in derived_mappings.items():
-            assert base in self.codes, f"Base color {base} not found for derived color {derived}"
-            self.codes[derived] = self.codes[base]
-    
-    @field_validator('codes')
-    def validate_color_codes(cls, codes: Dict[str, str]) -> Dict[str, str]:
-        """Validate all color codes follow the correct format."""
-        for code_name, color_value in codes.items():
-            # Assert color codes start with the prefix
-            assert color_value.startswith("^x"), f"Color code {code_name} must start with '^x'"
-            # Assert color codes are the correct length (prefix + 6 hex chars)
-            assert len(color_value) == 8, f"Color code {code_name} must be 8 characters (^x + 6 hex)"
-            # Assert the hex portion contains valid hex characters
-            hex_part = color_value[2:]
-            assert all(c in "0123456789ABCDEFabcdef" for c in hex_part), \
-                f"Color code {code_name} contains invalid hex characters"
-        return codes
-
-    @field_validator('rgb_highlight')
-    def validate_rgb_values(cls, rgb: Optional[Tuple[float, float, float]]) -> Optional[Tuple[float, float, float]]:
-        """Validate RGB values are within the correct range."""
-        if rgb is not None:
-            for component in rgb:
-                assert 0 <= component <= 1, f"RGB value {component} must be between 0 and 1"
-        return rgb
+        self.codes = dict(_DEFAULT_CODES)
+
+    def reset(self) -> None:
+        """Restore every color code to its default value."""
+        self.codes = dict(_DEFAULT_CODES)
+        self.rgb_highlight = _DEFAULT_RGB_HIGHLIGHT
 
     def update_color_code(self, code: str, color: str) -> None:
             """Update a specific color code."""
@@ -197,7 +252,8 @@ class ColorCodes(BaseModel):
             assert color.startswith("^x"), f"Invalid color prefix after processing: {color}"
             
             self.codes[code] = color
-            if code == ColorCode.HIGHLIGHT:
+            # Plain str compare: ColorCode members are str subclasses, so both spellings of the key match.
+            if code == "HIGHLIGHT":
                 self.rgb_highlight = self.hex_to_rgb(color)
 
     @staticmethod
@@ -205,25 +261,16 @@ class ColorCodes(BaseModel):
         """Convert a hex color string to RGB values."""
         # Pre-condition assertions
         assert isinstance(hex_color, str), f"Expected string, got {type(hex_color)}"
-        
-        hex_color = hex_color.replace("0x", "").replace("#", "")
-        if len(hex_color) != 6:
-            return None
-            
-        try:
-            rgb_values = tuple(int(hex_color[i:i+2], 16) / 255 for i in (0, 2, 4))
-            # Post-condition assertions
-            assert len(rgb_values) == 3, "RGB conversion failed to produce 3 values"
-            assert all(0 <= v <= 1 for v in rgb_values), "RGB values out of range"
-            return rgb_values  # type: ignore[return-value] # Tuple[float, float, float]
-        except ValueError:
-            return None
+
+        # Normalize before the cached call so "^xFFAA00", "0xFFAA00", "#FFAA00" and "FFAA00" share a cache slot.
+        return _hex_to_rgb(hex_color.removeprefix("^x").removeprefix("0x").removeprefix("#"))
 
 
 # Global instance
 COLOR_CODES = ColorCodes()
-DEFAULT_COLOR_CODES = ColorCodes()  # For reset capability
+# Read-only view of the defaults for reset and comparison. The defaults never change, so a second ColorCodes
+# instance would only be a duplicate copy of the table.
+DEFAULT_COLOR_CODES = types.MappingProxyType(_DEFAULT_CODES)
 
-# Verify global instances are properly initialized
-assert COLOR_CODES.codes == DEFAULT_COLOR_CODES.codes, "Default and active color codes should match on initialization"
-assert all(code in COLOR_CODES.codes for code in ColorCode), "Missing color codes in global instance"
\ No newline at end of file
+# Verify the default table covers every ColorCode
+assert all(code.value in DEFAULT_COLOR_CODES for code in ColorCode), "Missing color codes in default color codes"
\ No newline at end of file
@@ -5,7 +5,7 @@ This module defines the flag constants used throughout the application for
 determining modifier and keyword behaviors.
 """
 from enum import IntFlag
-from typing import Optional
+from typing import Final, Optional, Tuple
 
 
 class ModFlag(IntFlag):
@@ -48,27 +48,26 @@ class ModFlag(IntFlag):
     @classmethod
     def verify_weapon_flags(cls, flags: 'ModFlag') -> bool:
         """Verify weapon flags are consistent."""
-        weapon_type_flags = (cls.AXE | cls.BOW | cls.CLAW | cls.DAGGER | 
-                           cls.MACE | cls.STAFF | cls.SWORD | cls.WAND | 
-                           cls.UNARMED | cls.FISHING)
-        weapon_class_flags = cls.WEAPON_MELEE | cls.WEAPON_RANGED | cls.WEAPON_1H | cls.WEAPON_2H
-        
-        # A weapon flag cannot be both melee and ranged
-        assert not (flags & cls.WEAPON_MELEE and flags & cls.WEAPON_RANGED), \
-            "Weapon cannot be both melee and ranged"
-            
-        # A weapon flag cannot be both 1H and 2H
-        assert not (flags & cls.WEAPON_1H and flags & cls.WEAPON_2H), \
-            "Weapon cannot be both one-handed and two-handed"
-            
-        # If any weapon type is set, the WEAPON flag should be set
-        if flags & weapon_type_flags:
-            assert flags & cls.WEAPON, "WEAPON flag must be set when weapon type is specified"
-            
-        # If weapon class flags are set, at least one weapon type should be set
-        if flags & weapon_class_flags:
-            assert flags & weapon_type_flags, "Weapon type must be specified with weapon class"
-            
+        # The flag groups are precomputed module-level ints (below the class bodies), so every check is a
+        # plain int-and rather than an OR over enum members on each call. Every check below is an assert, so
+        # they all sit behind __debug__ for `python -O` to drop whole, mask tests included.
+        if __debug__:
+            # A weapon flag cannot be both melee and ranged
+            assert flags & _WEAPON_MELEE_AND_RANGED != _WEAPON_MELEE_AND_RANGED, \
+                "Weapon cannot be both melee and ranged"
+
+            # A weapon flag cannot be both 1H and 2H
+            assert flags & _WEAPON_1H_AND_2H != _WEAPON_1H_AND_2H, \
+                "Weapon cannot be both one-handed and two-handed"
+
+            # If any weapon type is set, the WEAPON flag should be set
+            if flags & _WEAPON_TYPE_MASK:
+                assert flags & _WEAPON, "WEAPON flag must be set when weapon type is specified"
+
+            # If weapon class flags are set, at least one weapon type should be set
+            if flags & _WEAPON_CLASS_MASK:
+                assert flags & _WEAPON_TYPE_MASK, "Weapon type must be specified with weapon class"
+
         return True
 
 
@@ -116,43 +115,66 @@ class KeywordFlag(IntFlag):
     @classmethod
     def verify_damage_types(cls, flags: 'KeywordFlag') -> bool:
         """Verify damage type flags are consistent."""
-        element_flags = cls.FIRE | cls.COLD | cls.LIGHTNING | cls.CHAOS | cls.PHYSICAL
-        
-        # If a DOT type is specified, the base damage type should also be specified
-        if flags & cls.PHYSICAL_DOT:
-            assert flags & cls.PHYSICAL, "Physical base type required for physical DOT"
-        if flags & cls.FIRE_DOT:
-            assert flags & cls.FIRE, "Fire base type required for fire DOT"
-        if flags & cls.COLD_DOT:
-            assert flags & cls.COLD, "Cold base type required for cold DOT"
-        if flags & cls.LIGHTNING_DOT:
-            assert flags & cls.LIGHTNING, "Lightning base type required for lightning DOT"
-        if flags & cls.CHAOS_DOT:
-            assert flags & cls.CHAOS, "Chaos base type required for chaos DOT"
-            
-        # If it's an ailment, it should have a damage type
-        if flags & cls.AILMENT:
-            assert flags & element_flags, "Ailment requires a damage type"
+        # Every check below is an assert, so they all sit behind __debug__ for `python -O` to drop whole,
+        # loop included.
+        if __debug__:
+            # If a DOT type is specified, the base damage type should also be specified
+            for dot_flag, base_flag, damage_name in _DOT_BASE_FLAGS:
+                if flags & dot_flag:
+                    assert flags & base_flag, f"{damage_name} base type required for {damage_name.lower()} DOT"
+
+            # If it's an ailment, it should have a damage type
+            if flags & _AILMENT:
+                assert flags & _ELEMENT_MASK, "Ailment requires a damage type"
             
         return True
 
 
+# Plain int mirrors of the flags used on the mod evaluation hot path. Bitwise ops against IntFlag members
+# resolve the member through the Enum class and re-box every result as a flag; plain ints stay on the C
+# fast path. The members remain the public, printable names.
+_MATCH_ALL: Final[int] = int(KeywordFlag.MATCH_ALL)
+# The complement of MATCH_ALL within KeywordFlag's 31-bit width, not `~_MATCH_ALL`: clearing MATCH_ALL has
+# always also dropped anything at bit 31 and above, and must keep doing so. This is also what
+# `~KeywordFlag.MATCH_ALL` evaluates to on the pinned CPython, but Flag.__invert__ has changed between
+# releases, so the value is spelled out and only cross-checked against it.
+_NOT_MATCH_ALL: Final[int] = 0x3FFFFFFF
+assert _NOT_MATCH_ALL == int(~KeywordFlag.MATCH_ALL), "KeywordFlag complement no longer matches _NOT_MATCH_ALL"
+
+# Flag groups for the verify methods, OR'd together once here instead of on every call.
+_WEAPON: Final[int] = int(ModFlag.WEAPON)
+_WEAPON_TYPE_MASK: Final[int] = int(
+    ModFlag.AXE | ModFlag.BOW | ModFlag.CLAW | ModFlag.DAGGER | ModFlag.MACE
+    | ModFlag.STAFF | ModFlag.SWORD | ModFlag.WAND | ModFlag.UNARMED | ModFlag.FISHING
+)
+_WEAPON_CLASS_MASK: Final[int] = int(ModFlag.WEAPON_MELEE | ModFlag.WEAPON_RANGED | ModFlag.WEAPON_1H | ModFlag.WEAPON_2H)
+# Mutually exclusive pairs: a flag set violates the pair exactly when both bits are present.
+_WEAPON_MELEE_AND_RANGED: Final[int] = int(ModFlag.WEAPON_MELEE | ModFlag.WEAPON_RANGED)
+_WEAPON_1H_AND_2H: Final[int] = int(ModFlag.WEAPON_1H | ModFlag.WEAPON_2H)
+_AILMENT: Final[int] = int(KeywordFlag.AILMENT)
+_ELEMENT_MASK: Final[int] = int(
+    KeywordFlag.FIRE | KeywordFlag.COLD | KeywordFlag.LIGHTNING | KeywordFlag.CHAOS | KeywordFlag.PHYSICAL
+)
+# (DOT flag, base damage type flag, damage name) for each damage type.
+_DOT_BASE_FLAGS: Final[Tuple[Tuple[int, int, str], ...]] = (
+    (int(KeywordFlag.PHYSICAL_DOT), int(KeywordFlag.PHYSICAL), "Physical"),
+    (int(KeywordFlag.FIRE_DOT), int(KeywordFlag.FIRE), "Fire"),
+    (int(KeywordFlag.COLD_DOT), int(KeywordFlag.COLD), "Cold"),
+    (int(KeywordFlag.LIGHTNING_DOT), int(KeywordFlag.LIGHTNING), "Lightning"),
+    (int(KeywordFlag.CHAOS_DOT), int(KeywordFlag.CHAOS), "Chaos"),
+)
+
 
 def match_keyword_flags(keyword_flags: int, mod_keyword_flags: int) -> bool:
     """Compare KeywordFlags to determine if the mod's flags are satisfied."""
-    # Pre-condition assertions
-    assert isinstance(keyword_flags, int), f"keyword_flags must be int, got {type(keyword_flags)}"
-    assert isinstance(mod_keyword_flags, int), f"mod_keyword_flags must be int, got {type(mod_keyword_flags)}"
-    
-    match_all = bool(mod_keyword_flags & KeywordFlag.MATCH_ALL)
-    mod_keyword_flags &= ~KeywordFlag.MATCH_ALL
-    keyword_flags &= ~KeywordFlag.MATCH_ALL
-    
-    # Assert the masks are properly cleared
-    assert not (keyword_flags & KeywordFlag.MATCH_ALL), "MATCH_ALL not properly cleared from keyword_flags"
-    assert not (mod_keyword_flags & KeywordFlag.MATCH_ALL), "MATCH_ALL not properly cleared from mod_keyword_flags"
-    
-    result = (keyword_flags & mod_keyword_flags) == mod_keyword_flags if match_all \
-        else mod_keyword_flags == 0 or (keyword_flags & mod_keyword_flags) != 0
-        
-    return result
\ No newline at end of file
+    # This runs for every mod on every evaluation, so it sticks to plain int masks and a single branch. The
+    # old per-call isinstance and mask-cleared asserts are gone: the first pair is what the type hints already
+    # state, and the second pair re-checked the `&` that cleared the bit one line earlier.
+    keywords = keyword_flags & _NOT_MATCH_ALL
+    mod_keywords = mod_keyword_flags & _NOT_MATCH_ALL
+    if mod_keyword_flags & _MATCH_ALL:
+        # Every keyword the mod names must be present.
+        return (keywords & mod_keywords) == mod_keywords
+    else:
+        # Any one keyword the mod names is enough, and a mod that names none always matches.
+        return mod_keywords == 0 or (keywords & mod_keywords) != 0
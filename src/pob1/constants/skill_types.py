@@ -5,7 +5,7 @@ This module defines the skill types from ActiveSkills.dat and GrantedEffects.dat
 Names are taken from ActiveSkillType.dat as of PoE 3.17.
 """
 from enum import IntEnum, auto
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 
 class SkillType(IntEnum):
@@ -139,10 +139,11 @@ class SkillType(IntEnum):
 
     def __str__(self) -> str:
         """Return a clean string representation of the skill type."""
-        return self.name.replace('_', ' ').title()
+        # Precomputed below the class body; reads _value_ directly to skip the `value` descriptor.
+        return _STR_CACHE[self._value_ - 1]
 
-    @classmethod
-    def get_description(cls, skill_type: 'SkillType') -> Optional[str]:
+    @staticmethod
+    def get_description(skill_type: 'SkillType') -> Optional[str]:
         """
         Get a human-readable description of a skill type.
         
@@ -152,31 +153,106 @@ class SkillType(IntEnum):
         Returns:
             A string description of the skill type if available, None otherwise
         """
-        descriptions: Dict[SkillType, str] = {
-            cls.PROJECTILE: "Skills which fire projectiles",
-            cls.DUAL_WIELD_ONLY: "Attack requires dual wielding",
-            cls.MAIN_HAND_ONLY: "Attack only uses main hand",
-            cls.MINION: "Creates or affects minions",
-            cls.DAMAGE: "Skill hits (not used on attacks as they all hit)",
-            cls.TRAPPABLE: "Can be turned into a trap",
-            cls.TOTEMABLE: "Can be turned into a totem",
-            cls.MINEABLE: "Can be turned into a mine",
-            cls.ELEMENTAL_STATUS: "Causes elemental status effects without hitting",
-            cls.MULTICASTABLE: "Can repeat via Spell Echo",
-            cls.MULTISTRIKEABLE: "Can repeat via Multistrike",
-            cls.CAUSES_BURNING: "Deals burning damage",
-            cls.RANDOM_ELEMENT: "Elements cannot repeat",
-            cls.ARCANE: "Relies on amount of mana spent",
-        }
-        return descriptions.get(skill_type)
+        return _DESCRIPTIONS.get(skill_type)
+
+
+# Human-readable descriptions, built once at import rather than on every get_description() call. IntEnum
+# members hash like their int values, so plain ints look up the same entries.
+_DESCRIPTIONS: Dict[SkillType, str] = {
+    SkillType.PROJECTILE: "Skills which fire projectiles",
+    SkillType.DUAL_WIELD_ONLY: "Attack requires dual wielding",
+    SkillType.MAIN_HAND_ONLY: "Attack only uses main hand",
+    SkillType.MINION: "Creates or affects minions",
+    SkillType.DAMAGE: "Skill hits (not used on attacks as they all hit)",
+    SkillType.TRAPPABLE: "Can be turned into a trap",
+    SkillType.TOTEMABLE: "Can be turned into a totem",
+    SkillType.MINEABLE: "Can be turned into a mine",
+    SkillType.ELEMENTAL_STATUS: "Causes elemental status effects without hitting",
+    SkillType.MULTICASTABLE: "Can repeat via Spell Echo",
+    SkillType.MULTISTRIKEABLE: "Can repeat via Multistrike",
+    SkillType.CAUSES_BURNING: "Deals burning damage",
+    SkillType.RANDOM_ELEMENT: "Elements cannot repeat",
+    SkillType.ARCANE: "Relies on amount of mana spent",
+}
+
+
+# The value <-> index tables below rely on auto() numbering every member contiguously from 1.
+assert all(member.value == index + 1 for index, member in enumerate(SkillType)), "SkillType values must be 1..N"
+
+# Raw member names indexed by value - 1, so hot paths holding a plain int never touch the Enum machinery.
+_NAMES: Tuple[str, ...] = tuple(member.name for member in SkillType)
+# Display strings indexed by value - 1, formatted once instead of on every str() call.
+_STR_CACHE: Tuple[str, ...] = tuple(name.replace('_', ' ').title() for name in _NAMES)
+
+
+def name_of(skill_type: int) -> str:
+    """
+    Get the raw member name of a skill type value.
+
+    Args:
+        skill_type: A SkillType member or its plain int value
+
+    Returns:
+        The member name, e.g. "ATTACK"
+
+    Raises:
+        ValueError: If the value is not a valid skill type, as SkillType(value) would
+    """
+    # Checked explicitly rather than by assert so that `python -O` keeps it: 0 and negative values would
+    # otherwise index from the end of the tuple.
+    if 1 <= skill_type <= len(_NAMES):
+        return _NAMES[skill_type - 1]
+    else:
+        raise ValueError(f"Invalid skill type value: {skill_type}")
+
+
+# Members indexed by value - 1. A tuple index is one C call, where SkillType(value) goes through
+# EnumType.__call__ and the value map, and raises through _missing_ for unknown values.
+_SKILL_BY_VALUE: Tuple[SkillType, ...] = tuple(SkillType)
+
+
+def skill_by_value(value: int) -> Optional[SkillType]:
+    """
+    Get the SkillType member for a plain int value.
+
+    Args:
+        value: The int value of a skill type
+
+    Returns:
+        The matching SkillType if the value is in range, None otherwise
+    """
+    # Checked explicitly rather than by catching IndexError: 0 and negative values would otherwise index
+    # from the end of the tuple.
+    if 1 <= value <= len(_SKILL_BY_VALUE):
+        return _SKILL_BY_VALUE[value - 1]
+    else:
+        return None
 
 
 # Global cache for optimization
 class GlobalCache:
-    """Global cache for storing computed data."""
-    cached_data = {
-        "MAIN": {},
-        "CALCS": {},
-        "CALCULATOR": {},
-        "CACHE": {},
-    }
\ No newline at end of file
+    """
+    Global cache for storing computed data, one dict per calculation mode.
+
+    The modes are fixed, so they are slots rather than keys of a shared class-level dict: attribute access
+    is a direct slot load, and the state lives on an instance that can be cleared.
+    """
+    __slots__ = ("main", "calcs", "calculator", "cache")
+
+    def __init__(self) -> None:
+        """Initialize every mode with an empty cache."""
+        self.main: Dict[str, object] = {}
+        self.calcs: Dict[str, object] = {}
+        self.calculator: Dict[str, object] = {}
+        self.cache: Dict[str, object] = {}
+
+    def clear(self) -> None:
+        """Drop every cached entry in every mode."""
+        self.main.clear()
+        self.calcs.clear()
+        self.calculator.clear()
+        self.cache.clear()
+
+
+# Global instance
+GLOBAL_CACHE = GlobalCache()